@@ -12,26 +12,102 @@ Usage example:
 '''
 
 from __future__ import annotations
-import json
+from functools import lru_cache
+
+try:
+    from typing import override
+except ImportError:
+    def override(method):
+        '''No-op replacement of typing.override for Python before 3.12.
+
+        Args:
+            method: Overriding method.
+
+        Returns:
+            The same method.
+        '''
+        return method
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from point import Point
+from serialization import dumps, loads
 from vector import Vector
 
+try:
+    from schema import PointModel, VectorModel, decode_container
+except ImportError:
+    decode_container = None
+
+POINT_KIND = 0
+VECTOR_KIND = 1
+
+_ALLOWED_TYPES = frozenset((Point, Vector))
+
+# Parsed JSON is only read while building a Container, so the same dict can
+# be safely reused when identical JSON is loaded again.
+_cached_loads = lru_cache(maxsize=32)(loads)
+_cached_decode = lru_cache(maxsize=32)(decode_container) \
+        if decode_container is not None else None
+
+
+def _element_to_json(element: Vector | Point) -> dict:
+    '''Converts Container element to dict while Container is serialized.
+
+    Used as default function of dumps, which calls it for every element it
+    can't serialize by itself.
+
+    Args:
+        Vector|Point element: Container element.
+
+    Returns:
+        Element JSON dictionary.
+    '''
+    return element.to_json(True)
+
+
+def _element_from_model(model: PointModel | VectorModel) -> Vector | Point:
+    '''Creates Container element from decoded schema model.
+
+    Args:
+        PointModel|VectorModel model: Element decoded by decode_container.
+
+    Returns:
+        Point for PointModel, Vector for VectorModel.
+    '''
+    if type(model) is PointModel:
+        return Point(model.x, model.y, model.z)
+
+    start, end = model.start_point, model.end_point
+    return Vector(
+        start_point=Point(start.x, start.y, start.z),
+        end_point=Point(end.x, end.y, end.z)
+    )
+
 
 class Container(list):
     '''Container which can only contain Points and Vectors
     '''
 
     @classmethod
-    def from_json(cls: Container,json_string: str = None,
-                  json_dict: dict = None) -> Container:
+    def from_json(cls: Container, json_string: str | bytes = None,
+                  json_dict: dict = None, trusted: bool = False) -> Container:
         '''Class method that creates a Container object from JSON.
 
         Args:
-            (optional) str json_string: String which if specified will be
-                parsed with json.parse method.
+            (optional) str|bytes json_string: String which if specified will be
+                parsed as JSON. If msgspec is installed, it is decoded
+                straight into typed models first. Results of parsing str or
+                bytes are cached, so loading the same string again skips
+                parsing. Other buffers such as bytearray aren't cached.
                 Default: None
             (optional) dict json_dict: Already parsed JSON dictionary.
+            (optional) bool trusted: Flag to create elements directly,
+                without validation, from JSON produced by Container.to_json.
+                Default: False.
         Either json_string or json_dict should be specified.
         Parsed or specified JSON dictionary should contain key 'element' with
             array of Point or Vector dictionaries.
@@ -46,8 +122,24 @@ class Container(list):
                 or Point.
             KeyError: json_dict doesn't contain necessary elements.
         '''
+        if json_string and _cached_decode is not None:
+            try:
+                if isinstance(json_string, (str, bytes)):
+                    model = _cached_decode(json_string)
+                else:
+                    model = decode_container(json_string)
+            except ValueError:
+                # JSON which doesn't strictly match the schema, e.g. with
+                # numbers stored as strings, is handled by dict-based parsing.
+                pass
+            else:
+                return Container(*map(_element_from_model, model.elements))
+
         if json_string:
-            json_dict = json.loads(json_string)
+            if isinstance(json_string, (str, bytes)):
+                json_dict = _cached_loads(json_string)
+            else:
+                json_dict = loads(json_string)
 
         if not json_dict:
             raise ValueError('Illegal Container JSON format')
@@ -55,14 +147,24 @@ class Container(list):
         approved_elements = []
         try:
             elements = json_dict['elements']
-            for element in elements:
-                if element['type'] == 'Vector':
-                    approved_elements.append(
-                        Vector.from_json(json_dict=element))
-                elif element['type'] == 'Point':
-                    approved_elements.append(
-                        Point.from_json(json_dict=element))
-        except (KeyError, ValueError) as exception:
+            if trusted:
+                for element in elements:
+                    element_type = element['type']
+                    if element_type == 'Vector':
+                        approved_elements.append(
+                            Vector._from_trusted_json(element))
+                    elif element_type == 'Point':
+                        approved_elements.append(
+                            Point._from_trusted_json(element))
+            else:
+                for element in elements:
+                    if element['type'] == 'Vector':
+                        approved_elements.append(
+                            Vector.from_json(json_dict=element))
+                    elif element['type'] == 'Point':
+                        approved_elements.append(
+                            Point.from_json(json_dict=element))
+        except (KeyError, ValueError, TypeError) as exception:
             raise ValueError('Illegal Container JSON format') from exception
 
         return Container(*approved_elements)
@@ -78,13 +180,10 @@ class Container(list):
             [Vector|Point] elements: Collection of elements to be added
                 to Container.
         '''
-        approved_elements = list(filter(
-            lambda el: isinstance(el, (Vector, Point)),
-            elements
-        ))
-        for arg in elements:
-            if isinstance(arg, (Point, Vector)):
-                approved_elements.append(arg)
+        approved_elements = [
+            element for element in elements
+            if type(element) in _ALLOWED_TYPES
+        ]
 
         super().__init__(approved_elements)
 
@@ -100,7 +199,7 @@ class Container(list):
         Raises:
             ValueError: Illegal argument type.
         '''
-        if not isinstance(element, (Vector, Point)):
+        if type(element) not in _ALLOWED_TYPES:
             raise ValueError('Can only add Vector or Point to Container')
 
         return super().append(element)
@@ -115,10 +214,10 @@ class Container(list):
         Args:
             [Vector|Point] elements: Collection of elements for extension.
         '''
-        approved_elements = list(filter(
-            lambda el: isinstance(el, (Vector, Point)),
-            elements
-        ))
+        approved_elements = [
+            element for element in elements
+            if type(element) in _ALLOWED_TYPES
+        ]
 
         return super().extend(approved_elements)
 
@@ -134,7 +233,7 @@ class Container(list):
         Raises:
             ValueError: Illegal argument type.
         '''
-        if not isinstance(element, (Vector, Point)):
+        if type(element) not in _ALLOWED_TYPES:
             raise ValueError('Can only add Vector or Point to Container')
 
         return super().insert(index, element)
@@ -148,12 +247,114 @@ class Container(list):
 
         Returns:
             If to_dict is set to True, returns a dict. Otherwise returns
-            the same dict converted to string with json.dumps.
+            the same dict serialized to JSON string.
         '''
-        json_dict = {
-            'elements': [element.to_json(True) for element in self],
-            'type': 'Container'
-        }
         if to_dict:
-            return json_dict
-        return json.dumps(json_dict)
+            return {
+                'elements': [element.to_json(True) for element in self],
+                'type': 'Container'
+            }
+        json_dict = {'elements': self, 'type': 'Container'}
+        return dumps(json_dict, default=_element_to_json).decode()
+
+    def to_arrays(self: Container) -> tuple:
+        '''Converts Container to NumPy structure of arrays.
+
+        Row i of every array describes i-th element of Container. Point is
+        treated as a vector from (0, 0, 0) to the Point, so coords is always
+        equal to end_points - start_points.
+
+        Returns:
+            Tuple (coords, start_points, end_points, kinds), where coords,
+            start_points and end_points are (N, 3) float64 arrays and kinds is
+            (N,) uint8 array of POINT_KIND or VECTOR_KIND values.
+
+        Raises:
+            ImportError: NumPy is not installed.
+        '''
+        if np is None:
+            raise ImportError('NumPy is required for Container.to_arrays')
+
+        # Filling flat lists and converting each of them once is much faster
+        # than assigning NumPy array rows one by one.
+        coords = []
+        start_points = []
+        end_points = []
+        kinds = []
+        for element in self:
+            coords.extend((element.x, element.y, element.z))
+            if type(element) is Vector:
+                start, end = element.start_point, element.end_point
+                start_points.extend((start.x, start.y, start.z))
+                end_points.extend((end.x, end.y, end.z))
+                kinds.append(VECTOR_KIND)
+            else:
+                start_points.extend((0, 0, 0))
+                end_points.extend((element.x, element.y, element.z))
+                kinds.append(POINT_KIND)
+
+        coords = np.array(coords, dtype=np.float64).reshape(-1, 3)
+        start_points = np.array(start_points, dtype=np.float64).reshape(-1, 3)
+        end_points = np.array(end_points, dtype=np.float64).reshape(-1, 3)
+        kinds = np.array(kinds, dtype=np.uint8)
+
+        return coords, start_points, end_points, kinds
+
+    def _coords_array(self: Container) -> np.ndarray:
+        '''Converts coordinates of Container elements to NumPy array.
+
+        Same as coords array of to_arrays, without building other arrays.
+
+        Returns:
+            (N, 3) float64 array of element coordinates.
+
+        Raises:
+            ImportError: NumPy is not installed.
+        '''
+        if np is None:
+            raise ImportError('NumPy is required for Container arrays')
+
+        coords = []
+        for element in self:
+            coords.extend((element.x, element.y, element.z))
+
+        return np.array(coords, dtype=np.float64).reshape(-1, 3)
+
+    def cross_all(self: Container, other: Container) -> np.ndarray:
+        '''Cross-products of elements of 2 Containers in pairs.
+
+        Points are treated as vectors from (0, 0, 0) to the Point.
+
+        Args:
+            Container other: Container of the same length.
+
+        Returns:
+            (N, 3) float64 array where row i is cross-product of i-th element
+            of current Container by i-th element of other.
+
+        Raises:
+            ValueError: other is not a Container or has different length.
+            ImportError: NumPy is not installed.
+        '''
+        if not isinstance(other, Container) or len(self) != len(other):
+            raise ValueError("Can't find cross-products of Containers")
+
+        return np.cross(self._coords_array(), other._coords_array())
+
+    def collinear_all(self: Container, other: Container) -> np.ndarray:
+        '''Checks if elements of 2 Containers are collinear in pairs.
+
+        Points are treated as vectors from (0, 0, 0) to the Point.
+
+        Args:
+            Container other: Container of the same length.
+
+        Returns:
+            (N,) bool array where item i is True if i-th elements of current
+            Container and other are collinear.
+
+        Raises:
+            ValueError: other is not a Container or has different length.
+            ImportError: NumPy is not installed.
+        '''
+        return np.all(self.cross_all(other) == 0, axis=1)
@@ -2,6 +2,7 @@ from enum import Enum
 from point import Point
 from vector import Vector
 from container import Container
+from serialization import dumps
 
 class State(Enum):
     '''
@@ -26,8 +27,8 @@ if __name__ == '__main__':
     print('5: Clear a Container')
     print('6: Exit')
 
-    with open('output.json') as file:
-        container = Container.from_json(file.read())
+    with open('output.json', 'rb') as file:
+        container = Container.from_json(file.read(), trusted=True)
     state = State.INPUT
 
     while True:
@@ -60,8 +61,8 @@ if __name__ == '__main__':
                 print(container)
                 state = State.INPUT
             case State.FILE_OUTPUT:
-                with open('output.json', 'w') as file:
-                    file.write(container.to_json())
+                with open('output.json', 'wb', buffering=1 << 20) as file:
+                    file.write(dumps(container.to_json(to_dict=True)))
                 state = State.INPUT
             case State.CLEAR:
                 container.clear()
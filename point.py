@@ -6,12 +6,31 @@ Usage example:
 '''
 
 from __future__ import annotations
-import re
-import json
 
-POINT_REGEX = r'\([+-]?([0-9]*[.])?[0-9]+;[+-]?([0-9]*[.])?[0-9]+;' + \
-        r'[+-]?([0-9]*[.])?[0-9]+\)'
-POINT_SPLITTERS = r'[\(;\)]'
+from serialization import dumps, loads
+
+
+def _parse_coordinate(string: str) -> float:
+    '''Converts coordinate string in format [+-]digits[.digits] to float.
+
+    Args:
+        str string: Coordinate string. Integer part may be omitted.
+
+    Returns:
+        Coordinate value.
+
+    Raises:
+        ValueError: String doesn't conform to coordinate format.
+    '''
+    digits = string[1:] if string[:1] in ('+', '-') else string
+    integer, dot, fraction = digits.partition('.')
+    if not dot:
+        integer, fraction = '', integer
+    if not digits.isascii() or not fraction.isdigit() or \
+            integer and not integer.isdigit():
+        raise ValueError(f'Illegal coordinate: {string}')
+
+    return float(string)
 
 
 class Point:
@@ -21,6 +40,8 @@ class Point:
         float x, y, z: Point coordinates.
     '''
 
+    __slots__ = ('x', 'y', 'z', '_json_cache')
+
     @classmethod
     def from_str(cls: Point, string: str) -> Point:
         '''Class method that creates a Point object from formatted string.
@@ -34,21 +55,24 @@ class Point:
         Raises:
             ValueError: String doesn't conform to input format.
         '''
-        if not re.match(POINT_REGEX, string):
-            raise ValueError('Illegal Point string format')
-
-        x, y, z = filter(None, re.split(POINT_SPLITTERS, string))
+        try:
+            if string[0] != '(' or string[-1] != ')':
+                raise ValueError('Illegal Point string format')
 
-        return cls(float(x), float(y), float(z))
+            x, y, z = string[1:-1].split(';')
+            return cls(_parse_coordinate(x), _parse_coordinate(y),
+                       _parse_coordinate(z))
+        except (IndexError, ValueError) as exception:
+            raise ValueError('Illegal Point string format') from exception
 
     @classmethod
-    def from_json(cls: Point, json_string: str = None,
+    def from_json(cls: Point, json_string: str | bytes = None,
                   json_dict: dict = None) -> Point:
         '''Class method that returns a Point object from JSON.
 
         Args:
-            (optional) str json_string: String which if specified will be
-                parsed with json.parse method.
+            (optional) str|bytes json_string: String which if specified will be
+                parsed as JSON.
                 Default: None
             (optional) dict json_dict: Already parsed JSON dictionary.
         Either json_string or json_dict should be specified.
@@ -65,7 +89,7 @@ class Point:
             KeyError: json_dict doesn't contain necessary elements.
         '''
         if json_string:
-            json_dict = json.loads(json_string)
+            json_dict = loads(json_string)
 
         if not json_dict:
             raise ValueError('Illegal Point JSON format')
@@ -79,6 +103,31 @@ class Point:
 
         return cls(x, y, z)
 
+    @classmethod
+    def _from_trusted_json(cls: Point, json_dict: dict) -> Point:
+        '''Class method that creates a Point from trusted JSON dict.
+
+        Bypasses __init__ and __setattr__. Coordinates are converted to float
+        like in from_json, but aren't validated otherwise.
+
+        Args:
+            dict json_dict: Dictionary produced by Point.to_json.
+
+        Returns:
+            Point object from JSON data.
+
+        Raises:
+            KeyError: json_dict doesn't contain necessary elements.
+            ValueError, TypeError: elements can't be converted to float.
+        '''
+        point = cls.__new__(cls)
+        object.__setattr__(point, 'x', float(json_dict['x']))
+        object.__setattr__(point, 'y', float(json_dict['y']))
+        object.__setattr__(point, 'z', float(json_dict['z']))
+        object.__setattr__(point, '_json_cache', None)
+
+        return point
+
     def __init__(self: Point, x: float | int, y: float | int, z: float | int):
         '''Point initializer.
 
@@ -86,15 +135,18 @@ class Point:
             float|int x, y, z: Point coordinates.
 
         Raises:
-            ValueError: Illegal coordinate type.
+            ValueError: Illegal coordinate type. Not checked when Python
+                runs with -O.
         '''
-        for value in (x, y, z):
-            if not isinstance(value, (float, int)):
-                raise ValueError(f'Illegal coordinate: {value}')
+        if __debug__:
+            for value in (x, y, z):
+                if not isinstance(value, (float, int)):
+                    raise ValueError(f'Illegal coordinate: {value}')
 
-        self.x = x
-        self.y = y
-        self.z = z
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'z', z)
+        object.__setattr__(self, '_json_cache', None)
 
     def __setattr__(self: Point, name: str, value: int | float):
         '''Point attribute setter.
@@ -105,15 +157,26 @@ class Point:
 
         Raises:
             AttributeError: Point doesn't have a specified attribute.
-            ValueError: Illegal value type.
+            ValueError: Illegal value type. Not checked when Python runs
+                with -O.
         '''
         if name not in ('x', 'y', 'z'):
             raise AttributeError(f'Point has no attribute {name}')
 
-        if not isinstance(value, (float, int)):
+        if __debug__ and not isinstance(value, (float, int)):
             raise ValueError(f'Illegal coordinate: {value}')
 
-        self.__dict__[name] = value
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_json_cache', None)
+
+    def __reduce__(self: Point) -> tuple:
+        '''Pickle and copy support.
+
+        Returns:
+            Tuple of object class and its coordinates, so that cached JSON
+            dict isn't copied.
+        '''
+        return self.__class__, (self.x, self.y, self.z)
 
     def __eq__(self: Point, other: Point) -> bool:
         '''Checks if Point is equal to other Point.
@@ -136,7 +199,7 @@ class Point:
         Returns:
             String formatted as '({point.x};{point.y};{point.z})'
         '''
-        return f'({self.x};{self.y};{self.z})'
+        return '(%s;%s;%s)' % (self.x, self.y, self.z)
 
     def __repr__(self: Point) -> str:
         '''Override to return same format as __str__.
@@ -153,14 +216,20 @@ class Point:
 
         Returns:
             If to_dict is set to True, returns a dict. Otherwise returns
-            the same dict converted to string with json.dumps.
+            the same dict serialized to JSON string.
+            The dict is cached until Point is modified and should not be
+            changed by caller.
         '''
-        json_dict = {
-            'x': self.x,
-            'y': self.y,
-            'z': self.z,
-            'type': 'Point'
-        }
+        json_dict = self._json_cache
+        if json_dict is None:
+            json_dict = {
+                'x': self.x,
+                'y': self.y,
+                'z': self.z,
+                'type': 'Point'
+            }
+            object.__setattr__(self, '_json_cache', json_dict)
+
         if to_dict:
             return json_dict
-        return json.dumps(json_dict)
+        return dumps(json_dict).decode()
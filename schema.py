@@ -0,0 +1,54 @@
+'''Typed schema of Container JSON.
+
+Requires msgspec. JSON is decoded straight into the models below, without
+building intermediate dicts.
+
+Usage example:
+    model = decode_container(b'{"elements": [], "type": "Container"}')
+    model.elements # []
+'''
+
+import msgspec
+
+
+class PointModel(msgspec.Struct, frozen=True, tag='Point', tag_field='type'):
+    '''Point JSON dictionary.
+    '''
+
+    x: float
+    y: float
+    z: float
+
+
+class VectorModel(msgspec.Struct, frozen=True, tag='Vector',
+                  tag_field='type'):
+    '''Vector JSON dictionary. Its coordinates are derived from the Points.
+    '''
+
+    start_point: PointModel
+    end_point: PointModel
+
+
+class ContainerModel(msgspec.Struct, frozen=True):
+    '''Container JSON dictionary.
+    '''
+
+    elements: tuple[PointModel | VectorModel, ...]
+
+
+_container_decoder = msgspec.json.Decoder(ContainerModel)
+
+
+def decode_container(data: str | bytes) -> ContainerModel:
+    '''Decodes Container JSON into ContainerModel.
+
+    Args:
+        str|bytes data: Container JSON document.
+
+    Returns:
+        ContainerModel with data from JSON.
+
+    Raises:
+        ValueError: data is not valid JSON or doesn't match the schema.
+    '''
+    return _container_decoder.decode(data)
@@ -0,0 +1,97 @@
+'''JSON serialization backend.
+
+Uses orjson if it is installed and falls back to the standard json module
+otherwise, or when orjson can't serialize a value, e.g. an integer which
+doesn't fit in 64 bits. Both backends accept and reject the same data,
+though numbers may be formatted differently.
+
+Usage example:
+    data = dumps({'x': 1.0}) # b'{"x":1.0}'
+    json_dict = loads(data) # {'x': 1.0}
+'''
+
+from collections.abc import Callable
+from math import isfinite
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(json_dict: dict | list, default: Callable = None) -> bytes:
+    '''Serializes JSON-compatible object to UTF-8 encoded bytes.
+
+    Args:
+        dict|list json_dict: Object to be serialized.
+        (optional) Callable default: Function that converts objects which
+            can't be serialized directly to serializable ones.
+            Default: None
+
+    Returns:
+        UTF-8 encoded JSON document.
+
+    Raises:
+        ValueError: json_dict contains NaN or infinite float.
+    '''
+    if orjson is not None:
+        try:
+            data = orjson.dumps(json_dict, default=default)
+        except orjson.JSONEncodeError:
+            # Values orjson doesn't support, like integers wider than 64
+            # bits, are left to the json module.
+            pass
+        else:
+            # orjson silently writes non-finite floats as null, so the object
+            # is only checked when the output contains null at all.
+            if b'null' in data:
+                _check_finite(json_dict, default)
+            return data
+
+    return json.dumps(json_dict, default=default, allow_nan=False,
+                      separators=(',', ':')).encode()
+
+
+def _check_finite(json_dict: object, default: Callable = None):
+    '''Checks that object doesn't contain NaN or infinite floats.
+
+    Args:
+        object json_dict: Object to be checked.
+        (optional) Callable default: Same function as passed to dumps.
+            Default: None
+
+    Raises:
+        ValueError: json_dict contains NaN or infinite float.
+    '''
+    if isinstance(json_dict, float):
+        if not isfinite(json_dict):
+            raise ValueError(
+                'Out of range float values are not JSON compliant')
+    elif isinstance(json_dict, dict):
+        for value in json_dict.values():
+            _check_finite(value, default)
+    elif isinstance(json_dict, (list, tuple)):
+        for value in json_dict:
+            _check_finite(value, default)
+    elif default is not None and json_dict is not None and \
+            not isinstance(json_dict, (str, int)):
+        _check_finite(default(json_dict), default)
+
+
+def loads(data: str | bytes) -> dict | list:
+    '''Parses JSON document.
+
+    Args:
+        str|bytes data: JSON document. Bytes are expected to be UTF-8 encoded.
+
+    Returns:
+        Parsed JSON object.
+
+    Raises:
+        ValueError: data is not a valid JSON document.
+    '''
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -14,20 +14,25 @@ Usage example:
 '''
 
 from __future__ import annotations
-import json
+from math import isclose
 
 from point import Point
+from serialization import dumps, loads
 
 
 class Vector(Point):
     '''3-dimensional Geometric Vector.
 
     Attributes:
-        float x, y, z: Vector coordinates.
+        float x, y, z: Vector coordinates. Updated when start_point or
+            end_point is assigned; changes made to the Points in place are
+            picked up by to_json.
         Point start_point: Vector start point.
         Point end_point: Vector end point.
     '''
 
+    __slots__ = ('start_point', 'end_point')
+
     @classmethod
     def from_str(cls: Vector, string: str) -> Vector:
         '''Class method that returns Vector object from string.
@@ -53,12 +58,13 @@ class Vector(Point):
         return cls(start_point=start_point, end_point=end_point)
 
     @classmethod
-    def from_json(json_string: str = None, json_dict: dict = None) -> Vector:
+    def from_json(cls: Vector, json_string: str | bytes = None,
+                  json_dict: dict = None) -> Vector:
         '''Class method that creates a Vector object from JSON.
 
         Args:
-            (optional) str json_string: String which if specified will be
-                parsed with json.parse.
+            (optional) str|bytes json_string: String which if specified will be
+                parsed as JSON.
             (optional) str json_dict: Already parsed JSON dictionary.
         Either json_string or json_dict should be specified.
         Parsed or specified JSON dictionary should contain keys 'x', 'y', 'z'
@@ -76,7 +82,7 @@ class Vector(Point):
             KeyError: dictionary doesn't contain necessary elements.
         '''
         if json_string:
-            json_dict = json.loads(json_string)
+            json_dict = loads(json_string)
 
         if not json_dict:
             raise ValueError('Illegal Vector JSON format')
@@ -91,6 +97,36 @@ class Vector(Point):
 
         return cls(start_point=start_point, end_point=end_point)
 
+    @classmethod
+    def _from_trusted_json(cls: Vector, json_dict: dict) -> Vector:
+        '''Class method that creates a Vector from trusted JSON dict.
+
+        Bypasses __init__ and __setattr__. Coordinates are computed from
+        the Points like in from_json, but aren't validated otherwise.
+
+        Args:
+            dict json_dict: Dictionary produced by Vector.to_json.
+
+        Returns:
+            Vector object from JSON data.
+
+        Raises:
+            KeyError: json_dict doesn't contain necessary elements.
+            ValueError, TypeError: Point elements can't be converted to float.
+        '''
+        start_point = Point._from_trusted_json(json_dict['start_point'])
+        end_point = Point._from_trusted_json(json_dict['end_point'])
+
+        vector = cls.__new__(cls)
+        object.__setattr__(vector, 'x', end_point.x - start_point.x)
+        object.__setattr__(vector, 'y', end_point.y - start_point.y)
+        object.__setattr__(vector, 'z', end_point.z - start_point.z)
+        object.__setattr__(vector, 'start_point', start_point)
+        object.__setattr__(vector, 'end_point', end_point)
+        object.__setattr__(vector, '_json_cache', None)
+
+        return vector
+
     @classmethod
     def cross(cls: Vector, first: Vector, second: Vector) -> Vector:
         '''Cross-product of 2 vectors.
@@ -105,7 +141,7 @@ class Vector(Point):
             raise ValueError("Can't find cross-product of non-vectors")
 
         x = first.y * second.z - first.z * second.y
-        y = first.x * second.z - first.z * second.x
+        y = first.z * second.x - first.x * second.z
         z = first.x * second.y - first.y * second.x
 
         return cls(x, y, z, start_point=first.start_point)
@@ -123,7 +159,7 @@ class Vector(Point):
         '''
         return cls.cross(first, second) * third
 
-    @classmethod
+    @staticmethod
     def collinear(first: Vector, second: Vector) -> bool:
         '''Checks if 2 vectors are collinear.
 
@@ -139,10 +175,13 @@ class Vector(Point):
         if not isinstance(first, Vector) or not isinstance(second, Vector):
             raise ValueError("Can't check if non-vectors are collinear")
 
-        return first.x / second.x == first.y / second.y == first.z / second.z
+        # Vectors are collinear when their cross-product is zero vector.
+        return first.y * second.z - first.z * second.y == 0 and \
+                first.z * second.x - first.x * second.z == 0 and \
+                first.x * second.y - first.y * second.x == 0
 
     def __init__(self: Vector, x: float | int = None, y: float | int = None,
-                 z: float | int = None, start_point: Point = Point(0, 0, 0),
+                 z: float | int = None, start_point: Point = None,
                  end_point: Point = None):
         '''Vector initializer.
 
@@ -150,31 +189,47 @@ class Vector(Point):
             (optional) float x, y, z
                 Default: None
             (optional) Point start_point
-                Default: Point at (0, 0, 0)
+                Default: None, which means new Point at (0, 0, 0)
             (optional) Point end_point
         x, y, z coordinates are passed to
 
         Raises:
             ValueError: Not enough values specified to initialize a Vector.
         '''
+        for point in (start_point, end_point):
+            if point is not None and not isinstance(point, Point):
+                raise ValueError(f'Illegal Point: {point}')
+
+        from_origin = start_point is None
+        if from_origin:
+            start_point = Point(0, 0, 0)
+
         if end_point is None:
             if x is None or y is None or z is None:
                 raise ValueError("Can't create a Vector from provided args")
             super().__init__(x, y, z)
-            self.end_point = Point(
-                start_point.x + x,
-                start_point.y + y,
-                start_point.z + z
-            )
-            self.start_point = start_point
+            if from_origin:
+                end_point = Point(x, y, z)
+            else:
+                end_point = Point(
+                    start_point.x + x,
+                    start_point.y + y,
+                    start_point.z + z
+                )
         else:
-            super().__init__(
-                end_point.x - start_point.x,
-                end_point.y - start_point.y,
-                end_point.z - start_point.z
-            )
-            self.start_point = start_point
-            self.end_point = end_point
+            if from_origin:
+                super().__init__(end_point.x, end_point.y, end_point.z)
+            else:
+                super().__init__(
+                    end_point.x - start_point.x,
+                    end_point.y - start_point.y,
+                    end_point.z - start_point.z
+                )
+
+        # Coordinates are already set, so Points are assigned without
+        # recomputing them in __setattr__.
+        object.__setattr__(self, 'start_point', start_point)
+        object.__setattr__(self, 'end_point', end_point)
 
     def __setattr__(self: Vector, name: str, value: int | float | Point):
         '''Vector attribute setter.
@@ -184,20 +239,57 @@ class Vector(Point):
                 'start_point', 'end_point'.
             int|float|Point value: New value to be set.
 
+        Setting a coordinate moves end_point, setting start_point or
+        end_point recomputes coordinates, so they always stay in sync.
+
         Raises:
             AttributeError: Vector doesn't have a specified attribute.
             ValueError: Illegal value type.
         '''
         if name in ('x', 'y', 'z'):
             super().__setattr__(name, value)
+            start_point, end_point = self.start_point, self.end_point
+            coordinates = {
+                'x': end_point.x, 'y': end_point.y, 'z': end_point.z
+            }
+            coordinates[name] = getattr(start_point, name) + value
+            object.__setattr__(self, 'end_point', Point(**coordinates))
         elif name in ('start_point', 'end_point'):
             if not isinstance(value, Point):
                 raise ValueError(f'Illegal Point: {value}')
 
-            self.__dict__[name] = value
+            object.__setattr__(self, name, value)
+            start_point, end_point = self.start_point, self.end_point
+            object.__setattr__(self, 'x', end_point.x - start_point.x)
+            object.__setattr__(self, 'y', end_point.y - start_point.y)
+            object.__setattr__(self, 'z', end_point.z - start_point.z)
+            object.__setattr__(self, '_json_cache', None)
         else:
             raise AttributeError(f'Vector has no attribute: {name}')
 
+    def __reduce__(self: Vector) -> tuple:
+        '''Pickle and copy support.
+
+        Returns:
+            Tuple of object class, arguments which recreate Vector from
+            its Points and its exact coordinates, so that cached JSON dict
+            isn't copied.
+        '''
+        return self.__class__, \
+                (None, None, None, self.start_point, self.end_point), \
+                (self.x, self.y, self.z)
+
+    def __setstate__(self: Vector, state: tuple):
+        '''Restores exact coordinates saved by __reduce__.
+
+        Args:
+            tuple state: Vector x, y, z coordinates.
+        '''
+        x, y, z = state
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'z', z)
+
     def __mul__(self: Vector, other: Vector | int | float) -> Vector | float:
         '''Multiplies current Vector by other Vector or number.
 
@@ -211,12 +303,14 @@ class Vector(Point):
         Raises:
             ValueError: Illegal argument type.
         '''
-        if isinstance(other, (float, int)):
+        other_type = type(other)
+        if other_type is float or other_type is int or \
+                isinstance(other, (float, int)):
             return Vector(
                 self.x * other, self.y * other, self.z * other,
                 start_point=self.start_point
             )
-        if isinstance(other, Vector):
+        if other_type is Vector or isinstance(other, Vector):
             return self.x * other.x + self.y * other.y + self.z * other.z
         raise ValueError(f"Can't multiply Vector by {type(other)}")
 
@@ -232,7 +326,7 @@ class Vector(Point):
         Raises:
             ValueError: Illegal argument type.
         '''
-        if not isinstance(other, Vector):
+        if type(other) is not Vector and not isinstance(other, Vector):
             raise ValueError(f"Can't add {type(other)} to Vector")
 
         return Vector(
@@ -252,11 +346,13 @@ class Vector(Point):
         Raises:
             ValueError: Illegal argument type.
         '''
-
-        if not isinstance(other, Vector):
+        if type(other) is not Vector and not isinstance(other, Vector):
             raise ValueError(f"Can't substract {type(other)} from Vector")
 
-        return self + -other
+        return Vector(
+            self.x - other.x, self.y - other.y, self.z - other.z,
+            start_point=self.start_point
+        )
 
     def __eq__(self: Vector, other: Vector) -> bool:
         '''Checks if Vector is equal to other Vector.
@@ -268,7 +364,7 @@ class Vector(Point):
             True if point coordinates are equal in pairs.
             False if coordinates are not equal, or other object is not a Vector.
         '''
-        if not isinstance(other, Vector):
+        if type(other) is not Vector and not isinstance(other, Vector):
             return False
 
         return self.start_point == other.start_point and \
@@ -280,7 +376,7 @@ class Vector(Point):
         Returns:
             String formatted as '{start_point}:{end_point}'
         '''
-        return f'{self.start_point}:{self.end_point}'
+        return '%s:%s' % (self.start_point, self.end_point)
 
     def __repr__(self: Vector) -> str:
         '''
@@ -288,6 +384,19 @@ class Vector(Point):
         '''
         return str(self)
 
+    def _sync_coordinates(self: Vector):
+        '''Recomputes coordinates which no longer match Vector's Points.
+
+        Points can be modified in place without Vector knowing about it.
+        Coordinates which still match the Points up to float rounding are
+        kept, so exact values passed to __init__ aren't lost.
+        '''
+        start_point, end_point = self.start_point, self.end_point
+        for name in ('x', 'y', 'z'):
+            value = getattr(end_point, name) - getattr(start_point, name)
+            if not isclose(value, getattr(self, name)):
+                object.__setattr__(self, name, value)
+
     def to_json(self: Vector, to_dict: bool = False) -> str:
         '''Converts Vector to JSON string or dict.
 
@@ -297,18 +406,29 @@ class Vector(Point):
 
         Returns:
             If to_dict is set to True, returns a dict. Otherwise returns
-            the same dict converted to string with json.dumps.
+            the same dict serialized to JSON string.
+            The dict is cached until Vector or its Points are modified and
+            should not be changed by caller.
         '''
-
-        json_dict = {
-            'start_point': self.start_point.to_json(True),
-            'end_point': self.end_point.to_json(True),
-            'x': self.x,
-            'y': self.y,
-            'z': self.z,
-            'type': 'Vector'
-        }
+        start_dict = self.start_point.to_json(True)
+        end_dict = self.end_point.to_json(True)
+
+        # Points can be modified without Vector knowing about it, so cached
+        # dict is only valid while it contains current dicts of both Points.
+        json_dict = self._json_cache
+        if json_dict is None or json_dict['start_point'] is not start_dict \
+                or json_dict['end_point'] is not end_dict:
+            self._sync_coordinates()
+            json_dict = {
+                'start_point': start_dict,
+                'end_point': end_dict,
+                'x': self.x,
+                'y': self.y,
+                'z': self.z,
+                'type': 'Vector'
+            }
+            object.__setattr__(self, '_json_cache', json_dict)
 
         if to_dict:
             return json_dict
-        return json.dumps(json_dict)
+        return dumps(json_dict).decode()